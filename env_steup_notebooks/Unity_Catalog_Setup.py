@@ -1,63 +1,93 @@
 # Databricks notebook source
-# MAGIC %sql
-# MAGIC -- Reset all user schemas in brickwell_health_dev catalog
-# MAGIC -- WARNING: This will permanently delete all data in these schemas!
-# MAGIC 
-# MAGIC -- CREATE Catalog
-# MAGIC CREATE CATALOG IF NOT EXISTS brickwell_health_dev;
-# MAGIC 
-# MAGIC -- Drop all schemas CASCADE
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev._meta CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev._vault CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_staging CASCADE;
-# MAGIC 
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_gold_claims CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_gold_billing CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_gold_policy CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_gold_reference CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_gold_regulatory CASCADE;
-# MAGIC 
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_silver_claims CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_silver_billing CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_silver_policy CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_silver_reference CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_silver_regulatory CASCADE;
-# MAGIC 
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_bronze_claims CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_bronze_billing CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_bronze_policy CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_bronze_reference CASCADE;
-# MAGIC DROP SCHEMA IF EXISTS brickwell_health_dev.edw_bronze_regulatory CASCADE;
-# MAGIC 
-# MAGIC 
-# MAGIC -- Recreate all schemas
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev._meta;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev._vault;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_staging;
-# MAGIC 
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_gold_claims;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_gold_billing;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_gold_policy;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_gold_reference;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_gold_regulatory;
-# MAGIC 
-# MAGIC 
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_silver_claims;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_silver_billing;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_silver_policy;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_silver_reference;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_silver_regulatory;
-# MAGIC 
-# MAGIC 
-# MAGIC 
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_bronze_claims;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_bronze_billing;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_bronze_policy;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_bronze_reference;
-# MAGIC CREATE SCHEMA IF NOT EXISTS brickwell_health_dev.edw_bronze_regulatory;
-# MAGIC 
-# MAGIC 
-# MAGIC -- Recreate all volumes
-# MAGIC 
-# MAGIC CREATE VOLUME brickwell_health_dev._vault.store;
-# MAGIC CREATE VOLUME brickwell_health_dev.edw_staging.incoming;
\ No newline at end of file
+# DBTITLE 1,Create Widgets
+dbutils.widgets.text("catalog", "brickwell_health_dev", "Catalog")
+dbutils.widgets.dropdown("reset", "false", ["false", "true"], "Drop and Recreate Catalog")
+
+catalog = dbutils.widgets.get("catalog").strip()
+reset = dbutils.widgets.get("reset").lower() == "true"
+
+# COMMAND ----------
+
+# DBTITLE 1,Define Schemas, Volumes and Helpers
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import itertools
+
+zones = ["gold", "silver", "bronze"]
+domains = ["claims", "billing", "policy", "reference", "regulatory"]
+
+zone_schemas = [f"edw_{z}_{d}" for z, d in itertools.product(zones, domains)]
+schemas = ["_meta", "_vault", "edw_staging"] + zone_schemas
+
+volumes = [
+    ("_vault", "store"),
+    ("edw_staging", "incoming"),
+]
+
+
+@lru_cache(maxsize=1)
+def existing_schemas(catalog_name: str) -> frozenset:
+    """
+    Schemas currently in the catalog, from a single information_schema query.
+
+    Cached so re-running cells interactively doesn't go back to the metastore;
+    call existing_schemas.cache_clear() after any DDL.
+    """
+    return frozenset(
+        r.schema_name
+        for r in spark.sql(f"SELECT schema_name FROM {catalog_name}.information_schema.schemata").collect()
+    )
+
+
+def enable_predictive_optimization(schema: str):
+    """Let Databricks schedule OPTIMIZE/VACUUM for every table in the schema."""
+    try:
+        spark.sql(f"ALTER SCHEMA {catalog}.{schema} ENABLE PREDICTIVE OPTIMIZATION")
+    except Exception as e:
+        print(f"  Warning: Could not enable predictive optimization on {schema}: {e}")
+
+# COMMAND ----------
+
+# DBTITLE 1,Reset Catalog
+# Only runs when reset=true
+# WARNING: This will permanently delete all data in the catalog!
+#
+# A single catalog-level DROP ... CASCADE replaces one DROP SCHEMA per schema,
+# so the metastore is hit once instead of once per schema.
+if reset:
+    print(f"Dropping catalog {catalog}")
+    spark.sql(f"DROP CATALOG IF EXISTS {catalog} CASCADE")
+    existing_schemas.cache_clear()
+
+spark.sql(f"CREATE CATALOG IF NOT EXISTS {catalog}")
+
+# COMMAND ----------
+
+# DBTITLE 1,Create Missing Schemas and Volumes
+missing = [s for s in schemas if s not in existing_schemas(catalog)]
+
+# Same idea for volumes: one information_schema query, then only create what is absent
+existing_volumes = {
+    (r.volume_schema, r.volume_name)
+    for r in spark.sql(f"SELECT volume_schema, volume_name FROM {catalog}.information_schema.volumes").collect()
+}
+missing_volumes = [v for v in volumes if v not in existing_volumes]
+
+# Each statement is an independent metastore call, so fan them out instead of
+# waiting on them one by one. Volumes are submitted only after every schema exists.
+with ThreadPoolExecutor(max_workers=16) as executor:
+    list(executor.map(
+        lambda s: spark.sql(f"CREATE SCHEMA IF NOT EXISTS {catalog}.{s}"),
+        missing,
+    ))
+    # Idempotent, so existing schemas are covered too (older catalogs, earlier failures)
+    list(executor.map(enable_predictive_optimization, zone_schemas))
+    list(executor.map(
+        lambda v: spark.sql(f"CREATE VOLUME IF NOT EXISTS {catalog}.{v[0]}.{v[1]}"),
+        missing_volumes,
+    ))
+
+if missing:
+    existing_schemas.cache_clear()
+
+print(f"Created {len(missing)} of {len(schemas)} schemas and {len(missing_volumes)} of {len(volumes)} volumes in {catalog}")
\ No newline at end of file
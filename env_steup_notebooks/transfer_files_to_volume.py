@@ -42,11 +42,21 @@ dbutils.widgets.text("month_limit", "2020-06", "Optional: Process only this spec
 dbutils.widgets.text("process_up_to", "", "Optional: Process all months from start up to this month (YYYY-MM)")
 dbutils.widgets.dropdown("max_workers", "4", ["1", "2", "4", "8", "16"],
                          "Max Parallel Workers (1=sequential)")
+dbutils.widgets.dropdown("copy_engine", "dbutils", ["dbutils", "spark"],
+                         "Copy Engine (spark=rewrite parquet partitions on executors)")
 dbutils.widgets.dropdown("dry_run", "true", ["true", "false"], "Dry Run")
 
 # COMMAND ----------
 
 # DBTITLE 1,Get Parameters
+def is_valid_month(value: str) -> bool:
+    """True for a YYYY-MM month string; shared by parameter, partition and tracking checks."""
+    return (
+        len(value) == 7 and value.isascii()
+        and value[:4].isdigit() and value[4] == "-" and value[5:].isdigit()
+    )
+
+
 source_volume_path = dbutils.widgets.get("source_volume_path")
 target_volume_path = dbutils.widgets.get("target_volume_path")
 tracking_catalog = dbutils.widgets.get("tracking_catalog")
@@ -55,8 +65,13 @@ restart = dbutils.widgets.get("restart").lower() == "true"
 month_limit = dbutils.widgets.get("month_limit").strip()
 process_up_to = dbutils.widgets.get("process_up_to").strip()
 max_workers = int(dbutils.widgets.get("max_workers"))
+copy_engine = dbutils.widgets.get("copy_engine")
 dry_run = dbutils.widgets.get("dry_run").lower() == "true"
 
+for name, value in [("month_limit", month_limit), ("process_up_to", process_up_to)]:
+    if value and not is_valid_month(value):
+        raise ValueError(f"{name} must be in YYYY-MM format, got: {value!r}")
+
 print(f"Configuration:")
 print(f"  Source Volume: {source_volume_path}")
 print(f"  Target Volume: {target_volume_path}")
@@ -66,6 +81,7 @@ print(f"  Restart: {restart}")
 print(f"  Month Limit: {month_limit if month_limit else 'None (process next available)'}")
 print(f"  Process Up To: {process_up_to if process_up_to else 'None (single month per run)'}")
 print(f"  Max Workers: {max_workers} {'(sequential)' if max_workers == 1 else '(parallel)'}")
+print(f"  Copy Engine: {copy_engine}")
 print(f"  Dry Run: {dry_run}")
 
 # COMMAND ----------
@@ -78,12 +94,24 @@ print(f"  Dry Run: {dry_run}")
 from pyspark.sql import SparkSession
 from pyspark.sql.types import StructType, StructField, StringType, LongType, TimestampType, IntegerType
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import re
+from typing import List, Dict, Iterator, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache
+import bisect
+import heapq
+import itertools
 
 spark = SparkSession.builder.getOrCreate()
 
+# Hadoop FileSystem handle straight from the JVM, used for listing and deleting
+# without dbutils.fs wrapping every entry in a FileInfo. Not reachable from Python
+# on serverless / Spark Connect, where the dbutils.fs code paths are used instead.
+try:
+    _Path = spark._jvm.org.apache.hadoop.fs.Path
+    _fs = _Path(source_volume_path).getFileSystem(spark._jsc.hadoopConfiguration())
+except Exception:
+    _fs, _Path = None, None
+
 # COMMAND ----------
 
 # MAGIC %md
@@ -107,26 +135,48 @@ table_schema = StructType([
 
 # COMMAND ----------
 
+# Deletes only wait on storage, so size the pool like the copy pool;
+# max_workers=1 keeps the cleanup sequential.
+_DELETE_WORKERS = 1 if max_workers == 1 else max_workers * 4
+
+
+def _delete_path(target_fs, name: str, path) -> bool:
+    """Recursively delete one entry of the target volume; True on success."""
+    try:
+        if target_fs is not None:
+            target_fs.delete(path, True)
+        else:
+            dbutils.fs.rm(path, recurse=True)
+        print(f"  Deleted: {name}")
+        return True
+    except Exception as e:
+        print(f"  Failed to delete {name}: {e}")
+        return False
+
+
 def cleanup_target_volume(target_path: str):
-    """Delete all subdirectories and files from the target volume."""
+    """
+    Delete all subdirectories and files from the target volume.
+
+    The volume itself is kept; its top-level entries are deleted in parallel.
+    """
     try:
         print(f"Cleaning up target volume: {target_path}")
-        items = dbutils.fs.ls(target_path)
+        # _fs belongs to the source volume; the target may live on another filesystem
+        target_fs = None
+        if _Path is not None:
+            target_fs = _Path(target_path).getFileSystem(spark._jsc.hadoopConfiguration())
+            items = [(status.getPath().getName(), status.getPath()) for status in target_fs.listStatus(_Path(target_path))]
+        else:
+            items = [(item.name, item.path) for item in dbutils.fs.ls(target_path)]
 
         if not items:
             print("  Target volume is already empty")
             return
 
-        deleted_count = 0
-        for item in items:
-            if item.name.startswith("."):
-                continue
-            try:
-                dbutils.fs.rm(item.path, recurse=True)
-                print(f"  Deleted: {item.name}")
-                deleted_count += 1
-            except Exception as e:
-                print(f"  Failed to delete {item.name}: {e}")
+        items = [(name, path) for name, path in items if not name.startswith(".")]
+        with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as executor:
+            deleted_count = sum(executor.map(lambda item: _delete_path(target_fs, *item), items))
 
         print(f"Cleanup complete: {deleted_count} item(s) deleted")
 
@@ -138,6 +188,27 @@ def cleanup_target_volume(target_path: str):
 
 # COMMAND ----------
 
+# DBTITLE 1,Get Last Processed Month
+def get_last_processed_month() -> Optional[str]:
+    """
+    Get the last processed simulation month from tracking table.
+
+    Looked up once per process_all_tables run, which then works from that value.
+    """
+    try:
+        result = spark.sql(f"""
+            SELECT MAX(simulation_month) as last_month
+            FROM {tracking_table}
+        """).collect()
+
+        if result and result[0]["last_month"]:
+            return result[0]["last_month"]
+        return None
+    except Exception:
+        return None
+
+# COMMAND ----------
+
 # DBTITLE 1,Initialize Tracking Table
 def initialize_tracking_table(recreate: bool = False):
     """Initialize or recreate the tracking table."""
@@ -175,14 +246,53 @@ initialize_tracking_table(recreate=restart)
 
 # COMMAND ----------
 
-# DBTITLE 1,Discover Schema/Table Paths
-def get_table_paths(base_path: str) -> List[Dict[str, str]]:
+# DBTITLE 1,Extract Months from Table Partitions
+# Partition folders are named extraction_month=YYYY-MM; plain prefix/slice checks
+# avoid running a regex on every directory entry.
+MONTH_PREFIX = "extraction_month="
+_MONTH_START = len(MONTH_PREFIX)
+_MONTH_END = _MONTH_START + len("YYYY-MM")
+
+
+def parse_partition_month(name: str) -> Optional[str]:
+    """
+    Return the YYYY-MM month of an extraction_month partition folder name, or None.
+
+    The name must end right after the month (dbutils adds a trailing '/' to
+    directories), so stray folders like extraction_month=2019_12_old are ignored.
     """
-    Discover all schema/table directories in the source volume.
+    if not name.startswith(MONTH_PREFIX) or name[_MONTH_END:] not in ("", "/"):
+        return None
+    month = name[_MONTH_START:_MONTH_END]
+    return month if is_valid_month(month) else None
+
+
+def extract_months_from_table(table_path: str) -> List[str]:
+    """
+    Extract all available months from partition folders in a table directory.
 
     Returns:
-        List of dicts with 'schema', 'table', 'path' keys.
+        Sorted list of month strings (YYYY-MM).
     """
+    months = []
+    try:
+        if _fs is not None:
+            names = [status.getPath().getName() for status in _fs.listStatus(_Path(table_path))]
+        else:
+            names = [item.name for item in dbutils.fs.ls(table_path)]
+        for name in names:
+            month = parse_partition_month(name)
+            if month:
+                months.append(month)
+    except Exception as e:
+        pass
+    return sorted(months)
+
+# COMMAND ----------
+
+# DBTITLE 1,Discover Schema/Table Paths
+def _get_table_paths_dbutils(base_path: str, with_months: bool = True) -> List[Dict]:
+    """Discover tables by walking schema and table directories with dbutils.fs.ls."""
     tables = []
     try:
         schemas = dbutils.fs.ls(base_path)
@@ -206,100 +316,149 @@ def get_table_paths(base_path: str) -> List[Dict[str, str]]:
     except Exception as e:
         print(f"Error listing source volume: {e}")
 
-    return sorted(tables, key=lambda t: f"{t['schema']}/{t['table']}")
+    if not with_months:
+        for table in tables:
+            table["months"] = None
+        return tables
 
-# COMMAND ----------
+    # One ls per table, so overlap the round-trips instead of waiting on each in turn
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        months_lists = executor.map(lambda t: extract_months_from_table(t["path"]), tables)
+        for table, months in zip(tables, months_lists):
+            table["months"] = months
 
-# DBTITLE 1,Extract Months from Table Partitions
-MONTH_PATTERN = re.compile(r"extraction_month=(\d{4}-\d{2})")
+    return tables
 
 
-def extract_months_from_table(table_path: str) -> List[str]:
+def get_table_paths(base_path: str, with_months: bool = True) -> List[Dict]:
     """
-    Extract all available months from partition folders in a table directory.
+    Discover all schema/table directories in the source volume, together with
+    the extraction months available for each table.
+
+    Uses two globStatus calls on the Hadoop FileSystem, one for the schema/table
+    directories and one for their extraction_month partitions, instead of one
+    listing per schema and per table; falls back to dbutils.fs.ls when the JVM is
+    not available. Tables without partitions are kept with an empty month list.
+
+    With with_months=False only the schema/table directories are listed and
+    'months' is None; that is all a run for one explicit month needs, since each
+    table then just checks its partition directly.
 
     Returns:
-        Sorted list of month strings (YYYY-MM).
+        List of dicts with 'schema', 'table', 'path', 'months' keys.
     """
-    months = []
+    if _fs is None:
+        tables = _get_table_paths_dbutils(base_path, with_months)
+        return sorted(tables, key=lambda t: f"{t['schema']}/{t['table']}")
+
+    root = base_path.rstrip("/")
+    tables = []
     try:
-        items = dbutils.fs.ls(table_path)
-        for item in items:
-            match = MONTH_PATTERN.search(item.name)
-            if match:
-                months.append(match.group(1))
+        for status in _fs.globStatus(_Path(f"{root}/*/*")) or []:
+            # Every Path method is a py4j round-trip, so fetch the path string once
+            # and split the schema/table names off it in Python
+            table_path = status.getPath().toString()
+            schema_name, table_name = table_path.rsplit("/", 2)[1:]
+            if schema_name.startswith(".") or table_name.startswith(".") or not status.isDirectory():
+                continue
+            tables.append({
+                "schema": schema_name,
+                "table": table_name,
+                "path": f"{table_path}/",
+                "months": None,
+            })
     except Exception as e:
-        pass
-    return sorted(months)
+        print(f"Error listing source volume: {e}")
+
+    if with_months and tables:
+        months_by_table: Dict[Tuple[str, str], List[str]] = {}
+        try:
+            # Partitions are recognized by name alone, as in the dbutils fallback
+            for status in _fs.globStatus(_Path(f"{root}/*/*/{MONTH_PREFIX}*")) or []:
+                _, schema_name, table_name, name = status.getPath().toString().rsplit("/", 3)
+                month = parse_partition_month(name)
+                if month:
+                    months_by_table.setdefault((schema_name, table_name), []).append(month)
+        except Exception as e:
+            print(f"Error listing partitions in source volume: {e}")
+        for table in tables:
+            table["months"] = sorted(months_by_table.get((table["schema"], table["table"]), []))
+
+    return sorted(tables, key=lambda t: f"{t['schema']}/{t['table']}")
+
+
+@lru_cache(maxsize=4)
+def get_cached_table_paths(base_path: str) -> Tuple[Dict, ...]:
+    """
+    Memoized get_table_paths for repeated inspection (e.g. re-running the dry run).
+
+    Re-run this cell to pick up changes in the source volume.
+    """
+    return tuple(get_table_paths(base_path))
 
 # COMMAND ----------
 
 # DBTITLE 1,Get Files for Specific Month
-def get_files_for_month(table_path: str, target_month: str) -> List[Tuple[str, int]]:
+def _iter_partition(partition_path: str) -> Iterator[Tuple[str, str, bool, int]]:
     """
-    Get all files inside a specific extraction_month partition.
+    Stream the entries of a partition directory.
 
-    Returns:
-        List of (file_path, size_bytes) tuples.
+    Yields:
+        (name, path, is_file, size_bytes) for each entry; nothing if the partition is missing.
     """
-    files = []
-    partition_path = f"{table_path}extraction_month={target_month}"
-
     try:
-        items = dbutils.fs.ls(partition_path)
-        for item in items:
-            if item.isFile() and not item.name.startswith("_"):
-                clean_path = item.path.replace("dbfs:", "") if item.path.startswith("dbfs:") else item.path
-                files.append((clean_path, item.size))
+        if _fs is not None:
+            statuses = _fs.listStatusIterator(_Path(partition_path))
+            while statuses.hasNext():
+                status = statuses.next()
+                yield status.getPath().getName(), status.getPath().toString(), status.isFile(), status.getLen()
+        else:
+            for item in dbutils.fs.ls(partition_path):
+                yield item.name, item.path, item.isFile(), item.size
     except Exception as e:
-        pass
+        return
 
-    return files
 
-# COMMAND ----------
+def summarize_partition(partition_path: str) -> Dict:
+    """
+    List a partition once and summarize its data files.
 
-# MAGIC %md
-# MAGIC ## 5. Transfer Logic
+    The data files are kept for the per-file copy, so a partition that needs it
+    is not listed a second time.
 
-# COMMAND ----------
+    Returns:
+        Dict with 'files' ((file_path, size_bytes) tuples, skipping directories and
+        _-prefixed marker files), 'file_count', 'total_bytes', 'data_only' (the partition
+        holds nothing but data files: no subdirectories or marker files) and
+        'parquet_only' (every data file is a .parquet file) keys.
+    """
+    summary = {"files": [], "file_count": 0, "total_bytes": 0, "data_only": True, "parquet_only": True}
+    for name, path, is_file, size in _iter_partition(partition_path):
+        if is_file and not name.startswith("_"):
+            clean_path = path.replace("dbfs:", "") if path.startswith("dbfs:") else path
+            summary["files"].append((clean_path, size))
+            summary["file_count"] += 1
+            summary["total_bytes"] += size
+            if not name.endswith(".parquet"):
+                summary["parquet_only"] = False
+        else:
+            summary["data_only"] = False
+    return summary
 
-# DBTITLE 1,Get Last Processed Month
-def get_last_processed_month() -> Optional[str]:
-    """Get the last processed simulation month from tracking table."""
-    try:
-        result = spark.sql(f"""
-            SELECT MAX(simulation_month) as last_month
-            FROM {tracking_table}
-        """).collect()
+# COMMAND ----------
 
-        if result and result[0]["last_month"]:
-            return result[0]["last_month"]
-        return None
-    except Exception:
-        return None
+# MAGIC %md
+# MAGIC ## 5. Transfer Logic
 
 # COMMAND ----------
 
 # DBTITLE 1,Get Next Simulation Month
-def get_next_simulation_month(last_processed: Optional[str]) -> Optional[str]:
+def get_next_simulation_month(last_processed: Optional[str], sorted_months: List[str]) -> Optional[str]:
     """
     Determine the next month to process across all tables.
 
-    Scans all tables for available months, returns the next one after last_processed.
+    Takes the sorted union of months found during discovery, returns the next one after last_processed.
     """
-    table_paths = get_table_paths(source_volume_path)
-
-    if not table_paths:
-        print("No tables found in source volume")
-        return None
-
-    all_months = set()
-    for tp in table_paths:
-        months = extract_months_from_table(tp["path"])
-        all_months.update(months)
-
-    sorted_months = sorted(all_months)
-
     if not sorted_months:
         print("No extraction_month partitions found in any table")
         return None
@@ -307,60 +466,133 @@ def get_next_simulation_month(last_processed: Optional[str]) -> Optional[str]:
     if last_processed is None:
         return sorted_months[0]
 
-    next_months = [m for m in sorted_months if m > last_processed]
-    return next_months[0] if next_months else None
+    idx = bisect.bisect_right(sorted_months, last_processed)
+    return sorted_months[idx] if idx < len(sorted_months) else None
 
 # COMMAND ----------
 
 # DBTITLE 1,Transfer Files for a Table/Month
+# Shared by every table so per-file copies stay bounded while tables run in parallel.
+# max_workers=1 keeps the whole run sequential.
+# Re-running this cell shuts down the previous pool and sizes a new one from the
+# current max_workers, so idle threads don't pile up in the notebook process.
+_COPY_WORKERS = 1 if max_workers == 1 else max_workers * 4
+if globals().get("_COPY_EXECUTOR") is not None:
+    _COPY_EXECUTOR.shutdown(wait=False)
+_COPY_EXECUTOR = ThreadPoolExecutor(max_workers=_COPY_WORKERS)
+
+# Copies in flight per table before waiting for one to finish
+_MAX_PENDING_COPIES = 2 * _COPY_WORKERS
+
+# Below this many files a Spark job's startup cost outweighs the parallel read/write
+SPARK_COPY_MIN_FILES = 4
+
+
+def _record_copy(stats: Dict, future, file_path: str, file_size: int):
+    """Fold the outcome of one file copy into the transfer stats."""
+    try:
+        future.result()
+        stats["transferred"] += 1
+        stats["bytes"] += file_size
+    except Exception as e:
+        stats["failed"] += 1
+        stats["errors"].append(f"{file_path}: {str(e)}")
+        print(f"    Failed: {file_path} - {e}")
+
+
 def transfer_files_for_table(
     schema_name: str,
     table_name: str,
-    table_path: str,
+    partition_path: str,
     target_month: str,
-    files: List[Tuple[str, int]],
+    summary: Dict,
 ) -> Dict:
-    """Transfer all files for a specific month from one table."""
+    """
+    Transfer all files for a specific month from one table.
+
+    With copy_engine=spark, parquet partitions of at least SPARK_COPY_MIN_FILES files
+    are rewritten to the target by a Spark job (file names and counts may change,
+    differing file schemas are merged so no columns are dropped, and the writer adds
+    its own _SUCCESS/_committed_*/_started_* marker files).
+    Otherwise, when the partition holds only data files, it is copied with a single
+    recursive cp. In every other case (or if those fail) the data files found by
+    summarize_partition are copied one by one, so marker files are left behind and
+    failures are reported per file.
+
+    Stats always describe the source files.
+    """
     stats = {"transferred": 0, "failed": 0, "bytes": 0, "errors": []}
 
-    if not files:
+    if not summary["file_count"]:
         return stats
 
     target_base = f"{target_volume_path}/{schema_name}/{table_name}/extraction_month={target_month}"
 
-    for file_path, file_size in files:
+    if copy_engine == "spark" and summary["parquet_only"] and summary["file_count"] >= SPARK_COPY_MIN_FILES:
+        try:
+            (
+                spark.read.option("mergeSchema", "true").parquet(partition_path)
+                .write.mode("overwrite")
+                .option("compression", "snappy")
+                .parquet(target_base)
+            )
+            stats["transferred"] = summary["file_count"]
+            stats["bytes"] = summary["total_bytes"]
+            return stats
+        except Exception as e:
+            print(f"    Spark copy failed, falling back to file copy: {partition_path} - {e}")
+            # The failed overwrite may have left part of its output behind; clear it so
+            # the fallback copy does not land next to stray part-* files
+            try:
+                dbutils.fs.rm(target_base, recurse=True)
+            except Exception as e:
+                print(f"    Could not clear partial Spark output: {target_base} - {e}")
+
+    if summary["data_only"]:
         try:
-            file_name = file_path.split("/")[-1]
-            target_path = f"{target_base}/{file_name}"
-            dbutils.fs.cp(file_path, target_path, recurse=False)
-            stats["transferred"] += 1
-            stats["bytes"] += file_size
+            dbutils.fs.cp(partition_path, target_base, recurse=True)
+            stats["transferred"] = summary["file_count"]
+            stats["bytes"] = summary["total_bytes"]
+            return stats
         except Exception as e:
-            stats["failed"] += 1
-            stats["errors"].append(f"{file_path}: {str(e)}")
-            print(f"    Failed: {file_path} - {e}")
+            print(f"    Partition copy failed, retrying file by file: {partition_path} - {e}")
+
+    target_prefix = target_base + "/"
+    pending = {}
+    for file_path, file_size in summary["files"]:
+        if len(pending) >= _MAX_PENDING_COPIES:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                _record_copy(stats, future, *pending.pop(future))
+
+        target_path = target_prefix + file_path[file_path.rfind("/") + 1:]
+        future = _COPY_EXECUTOR.submit(dbutils.fs.cp, file_path, target_path, recurse=False)
+        pending[future] = (file_path, file_size)
+
+    for future in as_completed(list(pending)):
+        _record_copy(stats, future, *pending.pop(future))
 
     return stats
 
 # COMMAND ----------
 
 # DBTITLE 1,Update Tracking Table
-def update_tracking(simulation_month: str, month_stats: Dict):
-    """Update tracking table with results for a simulation month."""
-    new_record = spark.createDataFrame([
-        (
-            simulation_month,
-            month_stats["total_tables_found"],
-            month_stats["tables_with_files"],
-            month_stats["tables_skipped"],
-            month_stats["total_files_transferred"],
-            month_stats["total_bytes_transferred"],
-            datetime.now(),
-            month_stats["status"],
-        )
-    ], table_schema)
+# Rows recorded by update_tracking, written to the tracking table by flush_tracking
+_pending_rows: List[Tuple] = []
+
 
-    new_record.write.format("delta").mode("append").saveAsTable(tracking_table)
+def update_tracking(simulation_month: str, month_stats: Dict):
+    """Record results for a simulation month; written to the tracking table by flush_tracking()."""
+    _pending_rows.append((
+        simulation_month,
+        month_stats["total_tables_found"],
+        month_stats["tables_with_files"],
+        month_stats["tables_skipped"],
+        month_stats["total_files_transferred"],
+        month_stats["total_bytes_transferred"],
+        datetime.now(),
+        month_stats["status"],
+    ))
 
     print(f"\nTracking Updated:")
     print(f"   Simulation Month: {simulation_month}")
@@ -370,6 +602,53 @@ def update_tracking(simulation_month: str, month_stats: Dict):
     print(f"   Total bytes: {month_stats['total_bytes_transferred']:,}")
     print(f"   Status: {month_stats['status']}")
 
+
+TRACKING_STATUSES = ("success", "partial", "failed")
+
+
+def _tracking_values(row: Tuple) -> str:
+    """Render a pending tracking row as a SQL VALUES tuple, validating the string fields."""
+    simulation_month, tables_found, tables_with_files, tables_skipped, files, bytes_, last_updated, status = row
+    if not is_valid_month(simulation_month):
+        raise ValueError(f"Invalid simulation month: {simulation_month!r}")
+    if status not in TRACKING_STATUSES:
+        raise ValueError(f"Invalid tracking status: {status!r}")
+    return (
+        f"('{simulation_month}', {int(tables_found)}, {int(tables_with_files)}, {int(tables_skipped)}, "
+        f"{int(files)}, {int(bytes_)}, TIMESTAMP'{last_updated.isoformat(sep=' ')}', '{status}')"
+    )
+
+
+def flush_tracking():
+    """
+    Write all pending tracking rows with a single MERGE.
+
+    One Delta commit per run instead of one per month, and re-processing a month
+    updates its row instead of appending a duplicate. The rows are inlined as a
+    VALUES literal, so no DataFrame has to be built and shipped to the JVM.
+    """
+    if not _pending_rows:
+        return
+
+    try:
+        values = ",\n                ".join(_tracking_values(row) for row in _pending_rows)
+        columns = ", ".join(field.name for field in table_schema.fields)
+        spark.sql(f"""
+            MERGE INTO {tracking_table} t
+            USING (VALUES
+                {values}
+            ) AS s({columns})
+            ON t.simulation_month = s.simulation_month
+            WHEN MATCHED THEN UPDATE SET *
+            WHEN NOT MATCHED THEN INSERT *
+        """)
+
+        print(f"\nTracking table updated: {len(_pending_rows)} month(s) written to {tracking_table}")
+    finally:
+        # Drop the rows even if the MERGE failed: a rerun records its months again, and
+        # leftovers would duplicate them in the source and fail every later MERGE
+        _pending_rows.clear()
+
 # COMMAND ----------
 
 # MAGIC %md
@@ -379,7 +658,7 @@ def update_tracking(simulation_month: str, month_stats: Dict):
 
 # DBTITLE 1,Process Single Table for Month
 def process_single_table_for_month(
-    table_info: Dict[str, str],
+    table_info: Dict,
     target_month: str,
 ) -> Dict:
     """
@@ -400,23 +679,24 @@ def process_single_table_for_month(
     }
 
     try:
-        available_months = extract_months_from_table(table_path)
-
-        if target_month not in available_months:
+        # months is None when discovery skipped month listing (explicit month_limit);
+        # the partition listing below then tells whether the table has data
+        if table_info["months"] is not None and target_month not in table_info["months"]:
             print(f"  SKIP {label}: no data for {target_month}")
             return result
 
-        files = get_files_for_month(table_path, target_month)
+        partition_path = f"{table_path}extraction_month={target_month}"
+        summary = summarize_partition(partition_path)
 
-        if not files:
+        if not summary["file_count"]:
             print(f"  SKIP {label}: no files found")
             return result
 
         result["has_files"] = True
-        print(f"  {label}: {len(files)} file(s) found")
+        print(f"  {label}: {summary['file_count']} file(s) found")
 
         transfer_stats = transfer_files_for_table(
-            schema_name, table_name, table_path, target_month, files
+            schema_name, table_name, partition_path, target_month, summary
         )
 
         result["files_transferred"] = transfer_stats["transferred"]
@@ -435,7 +715,40 @@ def process_single_table_for_month(
 # COMMAND ----------
 
 # DBTITLE 1,Process All Tables for Simulation Month
-def _process_single_month(table_paths: List[Dict[str, str]], target_month: str):
+# Table-level workers, created once and reused for every month of a multi-month run.
+# Tables only block on I/O (listing and copies), so plain threads are enough.
+# As with the copy pool, a re-run of this cell replaces the previous executor.
+if globals().get("_TABLE_EXECUTOR") is not None:
+    _TABLE_EXECUTOR.shutdown(wait=False)
+_TABLE_EXECUTOR = ThreadPoolExecutor(max_workers=max_workers)
+
+
+def _iter_parallel_results(table_paths: List[Dict], target_month: str) -> Iterator[Dict]:
+    """
+    Run every table on the table executor and yield results as they complete.
+
+    A table whose worker raised yields a zero-file result carrying the error.
+    """
+    future_to_table = {
+        _TABLE_EXECUTOR.submit(process_single_table_for_month, tp, target_month): tp["schema"] + "/" + tp["table"]
+        for tp in table_paths
+    }
+    for future in as_completed(future_to_table):
+        label = future_to_table[future]
+        try:
+            yield future.result()
+        except Exception as e:
+            print(f"  Exception processing {label}: {e}")
+            yield {
+                "label": label,
+                "has_files": False,
+                "files_transferred": 0,
+                "bytes_transferred": 0,
+                "errors": [f"{label}: {str(e)}"],
+            }
+
+
+def _process_single_month(table_paths: List[Dict], target_month: str):
     """
     Process all tables for a single simulation month and update tracking.
 
@@ -445,50 +758,26 @@ def _process_single_month(table_paths: List[Dict[str, str]], target_month: str):
     print(f"Processing Simulation Month: {target_month}")
     print(f"{'='*80}\n")
 
-    month_stats = {
-        "total_tables_found": len(table_paths),
-        "tables_with_files": 0,
-        "tables_skipped": 0,
-        "total_files_transferred": 0,
-        "total_bytes_transferred": 0,
-        "errors": [],
-    }
-
+    # Pick the execution mode once; the sequential path calls tables directly,
+    # without any future/result wrapping
     if max_workers == 1:
         print(f"  Processing tables sequentially...")
-        for table_info in table_paths:
-            result = process_single_table_for_month(table_info, target_month)
-            if result["has_files"]:
-                month_stats["tables_with_files"] += 1
-                month_stats["total_files_transferred"] += result["files_transferred"]
-                month_stats["total_bytes_transferred"] += result["bytes_transferred"]
-            else:
-                month_stats["tables_skipped"] += 1
-            if result["errors"]:
-                month_stats["errors"].extend(result["errors"])
+        results_iter = (process_single_table_for_month(tp, target_month) for tp in table_paths)
     else:
         print(f"  Processing tables in parallel (max {max_workers} workers)...")
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_table = {
-                executor.submit(process_single_table_for_month, tp, target_month): tp["schema"] + "/" + tp["table"]
-                for tp in table_paths
-            }
-            for future in as_completed(future_to_table):
-                label = future_to_table[future]
-                try:
-                    result = future.result()
-                    if result["has_files"]:
-                        month_stats["tables_with_files"] += 1
-                        month_stats["total_files_transferred"] += result["files_transferred"]
-                        month_stats["total_bytes_transferred"] += result["bytes_transferred"]
-                    else:
-                        month_stats["tables_skipped"] += 1
-                    if result["errors"]:
-                        month_stats["errors"].extend(result["errors"])
-                except Exception as e:
-                    print(f"  Exception processing {label}: {e}")
-                    month_stats["tables_skipped"] += 1
-                    month_stats["errors"].append(f"{label}: {str(e)}")
+        results_iter = _iter_parallel_results(table_paths, target_month)
+    results = list(results_iter)
+
+    # Aggregate once over the collected results instead of branching per table
+    tables_with_files = sum(1 for r in results if r["has_files"])
+    month_stats = {
+        "total_tables_found": len(table_paths),
+        "tables_with_files": tables_with_files,
+        "tables_skipped": len(results) - tables_with_files,
+        "total_files_transferred": sum(r["files_transferred"] for r in results),
+        "total_bytes_transferred": sum(r["bytes_transferred"] for r in results),
+        "errors": list(itertools.chain.from_iterable(r["errors"] for r in results)),
+    }
 
     if month_stats["errors"]:
         status = "partial" if month_stats["total_files_transferred"] > 0 else "failed"
@@ -518,8 +807,9 @@ def process_all_tables(specific_month: Optional[str] = None, up_to_month: Option
     print("Starting Incremental File Transfer (Global Simulation Month)")
     print("=" * 80)
 
-    # 1. Discover all schema/table paths
-    table_paths = get_table_paths(source_volume_path)
+    # 1. Discover all schema/table paths (month listing is only needed when
+    #    the month to process isn't given explicitly)
+    table_paths = get_table_paths(source_volume_path, with_months=not specific_month)
 
     if not table_paths:
         print("No tables found in source volume!")
@@ -532,45 +822,36 @@ def process_all_tables(specific_month: Optional[str] = None, up_to_month: Option
         # Single explicit month
         months_to_process = [specific_month]
         print(f"User-specified simulation month: {specific_month}")
-    elif up_to_month:
-        # All months from current position up to (and including) up_to_month
+    else:
+        # Union of months across all tables, computed once from the discovery results.
+        # Each table's months are already sorted, so merge them rather than re-sorting.
+        sorted_months = [m for m, _ in itertools.groupby(heapq.merge(*(tp["months"] for tp in table_paths)))]
+
         last_processed = get_last_processed_month()
         if last_processed:
             print(f"Last processed simulation month: {last_processed}")
         else:
             print(f"First run - no previous months processed")
 
-        # Gather all available months across all tables
-        all_months = set()
-        for tp in table_paths:
-            all_months.update(extract_months_from_table(tp["path"]))
-        sorted_months = sorted(all_months)
-
-        if last_processed is None:
-            months_to_process = [m for m in sorted_months if m <= up_to_month]
-        else:
-            months_to_process = [m for m in sorted_months if m > last_processed and m <= up_to_month]
+        if up_to_month:
+            # All months from current position up to (and including) up_to_month
+            start = 0 if last_processed is None else bisect.bisect_right(sorted_months, last_processed)
+            months_to_process = sorted_months[start:bisect.bisect_right(sorted_months, up_to_month)]
 
-        if not months_to_process:
-            print(f"\nNo unprocessed months found up to {up_to_month}.")
-            print("=" * 80)
-            return
+            if not months_to_process:
+                print(f"\nNo unprocessed months found up to {up_to_month}.")
+                print("=" * 80)
+                return
 
-        print(f"Will process {len(months_to_process)} month(s): {months_to_process[0]} .. {months_to_process[-1]}")
-    else:
-        # Default: single next month
-        last_processed = get_last_processed_month()
-        if last_processed:
-            print(f"Last processed simulation month: {last_processed}")
+            print(f"Will process {len(months_to_process)} month(s): {months_to_process[0]} .. {months_to_process[-1]}")
         else:
-            print(f"First run - no previous months processed")
-
-        target_month = get_next_simulation_month(last_processed)
-        if target_month is None:
-            print("\nAll simulation months have been processed!")
-            print("=" * 80)
-            return
-        months_to_process = [target_month]
+            # Default: single next month
+            target_month = get_next_simulation_month(last_processed, sorted_months)
+            if target_month is None:
+                print("\nAll simulation months have been processed!")
+                print("=" * 80)
+                return
+            months_to_process = [target_month]
 
     # 3. Process each month
     grand_totals = {
@@ -580,14 +861,18 @@ def process_all_tables(specific_month: Optional[str] = None, up_to_month: Option
         "failed_months": [],
     }
 
-    for target_month in months_to_process:
-        month_stats = _process_single_month(table_paths, target_month)
-
-        grand_totals["months_processed"] += 1
-        grand_totals["total_files"] += month_stats["total_files_transferred"]
-        grand_totals["total_bytes"] += month_stats["total_bytes_transferred"]
-        if month_stats["status"] != "success":
-            grand_totals["failed_months"].append(target_month)
+    try:
+        for target_month in months_to_process:
+            month_stats = _process_single_month(table_paths, target_month)
+
+            grand_totals["months_processed"] += 1
+            grand_totals["total_files"] += month_stats["total_files_transferred"]
+            grand_totals["total_bytes"] += month_stats["total_bytes_transferred"]
+            if month_stats["status"] != "success":
+                grand_totals["failed_months"].append(target_month)
+    finally:
+        # Completed months are recorded even if a later month raises
+        flush_tracking()
 
     # 4. Grand summary
     print("\n" + "=" * 80)
@@ -620,9 +905,9 @@ if not dry_run:
 else:
     print("Dry run - no files will be transferred")
     print(f"\nSource volume contents:")
-    table_paths = get_table_paths(source_volume_path)
+    table_paths = get_cached_table_paths(source_volume_path)
     for tp in table_paths:
-        months = extract_months_from_table(tp["path"])
+        months = tp["months"]
         print(f"  {tp['schema']}/{tp['table']}: {len(months)} months ({months[0]}..{months[-1]})" if months else f"  {tp['schema']}/{tp['table']}: empty")
 
 # COMMAND ----------
@@ -724,3 +1009,7 @@ display(
 # MAGIC - **max_workers=1**: Sequential (safest, for debugging)
 # MAGIC - **max_workers=4**: Recommended for most cases
 # MAGIC - **max_workers=8+**: Aggressive (use with many tables)
+# MAGIC
+# MAGIC ### Copy Engine
+# MAGIC - **copy_engine=dbutils** (default): Files are copied as-is from the driver
+# MAGIC - **copy_engine=spark**: Parquet partitions with 4+ files are read and rewritten by a Spark job, spreading the I/O over the executors. File names and counts in the target may differ from the source, and files with differing schemas are merged into one schema (`mergeSchema`), with columns missing from a file written as null. The Spark writer also adds its own `_SUCCESS`/`_committed_*`/`_started_*` marker files to the target, which the dbutils paths never copy; other partitions still use dbutils